@@ -1,16 +1,25 @@
 """Configuration loading for SearXNG MCP."""
 
-import json
+import functools
 import os
 from pathlib import Path
 from typing import Optional
 
 from .models import Config
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    import json as orjson  # type: ignore[no-redef]
+
 
 def load_config(config_path: Optional[str] = None) -> Config:
     """Load configuration from file or environment.
 
+    Configs read from a file are cached per resolved path for the
+    lifetime of the process. Defaults used when no file exists are not
+    cached, so a config file created later is still picked up.
+
     Args:
         config_path: Optional path to config file
 
@@ -28,10 +37,23 @@ def load_config(config_path: Optional[str] = None) -> Config:
             # Default location
             config_file = Path("searxng-config/config.json")
 
+    config_file = config_file.resolve()
     if config_file.exists():
-        with open(config_file) as f:
-            data = json.load(f)
-        return Config(**data)
+        return _load_config_file(str(config_file))
 
     # Return defaults if no config found
     return Config()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_file(config_path: str) -> Config:
+    """Load and validate a config file, caching the result.
+
+    Args:
+        config_path: Resolved path to an existing config file
+
+    Returns:
+        Loaded configuration
+    """
+    data = orjson.loads(Path(config_path).read_bytes())
+    return Config(**data)
@@ -4,7 +4,6 @@ import logging
 import sys
 from typing import Optional, Annotated, Literal
 
-from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 
 from .config import load_config
@@ -52,20 +51,21 @@ Use this when:
 - Looking for in-depth analysis
 - User asks to "research", "investigate", or "give me a briefing"
 
-This tool runs 2-6 searches automatically using different strategies:
+This tool runs up to 2-6 searches concurrently using different strategies:
 - Searches multiple engines (Google, Bing, DuckDuckGo, Brave, Wikipedia)
 - Searches both general web and news sources
 - Deduplicates results across all searches
-- Returns 15-50 UNIQUE sources depending on depth
+- Returns up to 15-50 UNIQUE sources depending on depth, stopping early
+  once the cap is reached
 
 Perfect for creating comprehensive briefings with validated information.
 
 Parameters:
 query* - Research topic
 depth - Research thoroughness:
-  • "quick" - 2 searches, ~15 unique sources
-  • "standard" - 4 searches, ~30 unique sources (recommended)
-  • "deep" - 6 searches, ~50 unique sources
+  • "quick" - up to 2 searches, up to 15 unique sources
+  • "standard" - up to 4 searches, up to 30 unique sources (recommended)
+  • "deep" - up to 6 searches, up to 50 unique sources
 
 CRITICAL - After receiving sources, you MUST:
 1. Read and analyze ALL sources provided (titles, URLs, content snippets)
@@ -101,6 +101,8 @@ class SearxngMCPServer:
         )
 
         # Initialize MCP server
+        from mcp.server.fastmcp import FastMCP
+
         self.mcp = FastMCP("SearxngMCP")
         self._setup_tools()
 
@@ -132,39 +134,51 @@ class SearxngMCPServer:
 
         self.logger = logging.getLogger("searxng-mcp")
         self.logger.info("SearXNG MCP Server initialized")
-        self.logger.info(f"SearXNG URL: {self.config.searxng.url}")
+        self.logger.info("SearXNG URL: %s", self.config.searxng.url)
 
     def _setup_tools(self) -> None:
         """Register MCP tools with the server."""
-
-        @self.mcp.tool(description=SEARCH_DESC)
-        def search(
-            query: Annotated[str, Field(description="Search query")],
-            category: Annotated[Literal["general", "news"], Field(description="Search category")] = "general",
-            engines: Annotated[Optional[str], Field(description="Comma-separated engine list")] = None,
-            max_results: Annotated[int, Field(description="Maximum results", ge=1, le=50)] = 10
-        ):
-            return self.search_tools.search(query, category, engines, max_results)
-
-        @self.mcp.tool(description=SEARCH_MEDIA_DESC)
-        def search_media(
-            query: Annotated[str, Field(description="Media search query")],
-            media_type: Annotated[Literal["images", "videos"], Field(description="Type of media")] = "images",
-            engines: Annotated[Optional[str], Field(description="Comma-separated engine list")] = None,
-            max_results: Annotated[int, Field(description="Maximum results", ge=1, le=50)] = 10
-        ):
-            return self.search_tools.search_media(query, media_type, engines, max_results)
-
-        @self.mcp.tool(description=RESEARCH_TOPIC_DESC)
-        def research_topic(
-            query: Annotated[str, Field(description="Research topic or question")],
-            depth: Annotated[Literal["quick", "standard", "deep"], Field(description="Research depth")] = "standard"
-        ):
-            return self.search_tools.research_topic(query, depth)
+        self.mcp.tool(description=SEARCH_DESC)(self.search)
+        self.mcp.tool(description=SEARCH_MEDIA_DESC)(self.search_media)
+        self.mcp.tool(description=RESEARCH_TOPIC_DESC)(self.research_topic)
+
+    # Tool signatures live at class scope so their annotations are built
+    # once at import time rather than on every server instantiation.
+
+    async def search(
+        self,
+        query: Annotated[str, Field(description="Search query")],
+        category: Annotated[Literal["general", "news"], Field(description="Search category")] = "general",
+        engines: Annotated[Optional[str], Field(description="Comma-separated engine list")] = None,
+        max_results: Annotated[int, Field(description="Maximum results", ge=1, le=50)] = 10
+    ):
+        """Quick web or news search tool."""
+        return await self.search_tools.search(query, category, engines, max_results)
+
+    async def search_media(
+        self,
+        query: Annotated[str, Field(description="Media search query")],
+        media_type: Annotated[Literal["images", "videos"], Field(description="Type of media")] = "images",
+        engines: Annotated[Optional[str], Field(description="Comma-separated engine list")] = None,
+        max_results: Annotated[int, Field(description="Maximum results", ge=1, le=50)] = 10
+    ):
+        """Image and video search tool."""
+        return await self.search_tools.search_media(query, media_type, engines, max_results)
+
+    async def research_topic(
+        self,
+        query: Annotated[str, Field(description="Research topic or question")],
+        depth: Annotated[Literal["quick", "standard", "deep"], Field(description="Research depth")] = "standard"
+    ):
+        """Multi-search research tool."""
+        return await self.search_tools.research_topic(query, depth)
 
     async def run(self):
         """Run the MCP server."""
-        await self.mcp.run_stdio_async()
+        try:
+            await self.mcp.run_stdio_async()
+        finally:
+            await self.search_tools.aclose()
 
 
 def main():
@@ -1,10 +1,196 @@
 """Search tools for SearXNG MCP."""
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Literal
-import requests
+import time
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Any, Hashable, List, Optional, Literal, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from mcp.types import TextContent
 
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    import json as orjson  # type: ignore[no-redef]
+
+_SEP = "=" * 80
+
+# Static sections of the research_topic output
+_RESEARCH_SOURCES_BANNER = (
+    f"{_SEP}\n"
+    "RAW SOURCE MATERIAL (analyze and synthesize - do NOT list to user):\n"
+    f"{_SEP}\n\n"
+)
+_RESEARCH_TASK_BANNER = (
+    f"\n{_SEP}\n"
+    "⚠️  YOUR TASK: ANALYZE & SYNTHESIZE (NOT list sources!)\n"
+    f"{_SEP}\n\n"
+)
+_RESEARCH_INSTRUCTIONS = (
+    "REQUIRED ANALYSIS PROCESS:\n"
+    "1. Read all source titles and content snippets above\n"
+    "2. Extract key claims and facts from the content\n"
+    "3. Cross-reference: What do MULTIPLE sources say? (HIGH confidence)\n"
+    "4. What's only in ONE source? (LOW confidence - note as unverified)\n"
+    "5. Any contradictions between sources? (flag for user)\n\n"
+    "REQUIRED OUTPUT FORMAT:\n"
+    "- Executive summary (2-3 sentences)\n"
+    "- Key findings with confidence indicators:\n"
+    "  ✓ HIGH (5+ sources agree)\n"
+    "  ~ MEDIUM (2-4 sources)\n"
+    "  ? LOW (single source only)\n"
+    "- Contradictions/uncertainties if any\n"
+    "- Brief conclusion\n\n"
+    "DO NOT output source URLs or numbered lists - synthesize into narrative!\n"
+    f"{_SEP}\n"
+)
+
+# Unique sources included in research output per depth; research stops
+# once this many are gathered
+RESEARCH_MAX_SOURCES = {"quick": 15, "standard": 30, "deep": 50}
+
+# Research search strategies per depth as (category, engines) pairs;
+# engines=None queries all enabled engines
+RESEARCH_STRATEGIES: Dict[str, Tuple[Tuple[str, Optional[str]], ...]] = {
+    "quick": (
+        ("general", None),
+        ("news", None),
+    ),
+    "standard": (
+        ("general", "google,bing"),
+        ("general", "duckduckgo,brave"),
+        ("news", None),
+        ("general", "wikipedia"),
+    ),
+    "deep": (
+        ("general", "google,bing"),
+        ("general", "duckduckgo,brave"),
+        ("news", "google,bing"),
+        ("news", "duckduckgo"),
+        ("general", "wikipedia"),
+        ("general", None),
+    ),
+}
+
+# Connection cap for the HTTP client. Over HTTPS all searches share one
+# multiplexed HTTP/2 connection; plain HTTP needs one per concurrent
+# request, so allow two deep research calls to run side by side
+POOL_SIZE = 2 * max(len(strategies) for strategies in RESEARCH_STRATEGIES.values())
+
+# Results taken from each research search per depth
+RESEARCH_MAX_PER_SEARCH = {"quick": 10, "standard": 10, "deep": 15}
+
+# How long parsed SearXNG responses are reused, in seconds
+CACHE_TTL = 300
+NEWS_CACHE_TTL = 60
+CACHE_MAX_SIZE = 128
+
+# Clock used for cache expiry; tests replace this instead of time.monotonic
+_monotonic = time.monotonic
+
+# Query parameters that only track clicks and never change the page
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid"})
+
+
+class _TTLCache:
+    """Small cache whose entries expire after a per-entry TTL.
+
+    Only used from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, maxsize: int):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a cached value, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= _monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds, evicting the oldest entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime in seconds
+        """
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            now = _monotonic()
+            for stale in [k for k, (exp, _) in self._data.items() if exp <= now]:
+                del self._data[stale]
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+        self._data[key] = (_monotonic() + ttl, value)
+
+
+def _truncate(text: str, limit: int = 200) -> str:
+    """Shorten text to a snippet, adding an ellipsis when cut.
+
+    Args:
+        text: Text to shorten
+        limit: Maximum characters kept
+
+    Returns:
+        Truncated text
+    """
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _canonicalize(url: str) -> str:
+    """Normalize a URL for duplicate detection.
+
+    Lowercases scheme and host, strips trailing slashes and drops
+    tracking query parameters and in-page anchors. Hash-route fragments
+    ("#/..." or "#!...") identify distinct pages and are kept. Malformed
+    URLs are returned unchanged.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Canonical form of the URL
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = urlencode([
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith("utm_") and key not in _TRACKING_PARAMS
+    ])
+    fragment = parts.fragment if parts.fragment.startswith(("/", "!")) else ""
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        query,
+        fragment,
+    ))
+
 
 class SearchTools:
     """Tools for searching via SearXNG."""
@@ -20,7 +206,34 @@ class SearchTools:
         self.timeout = timeout
         self.logger = logging.getLogger("searxng-mcp.search")
 
-    def _search(
+        self._cache = _TTLCache(CACHE_MAX_SIZE)
+
+        # HTTP client is created on first search to keep startup fast
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Get the shared HTTP client, creating it on first use.
+
+        Returns:
+            Client reusing connections to the SearXNG instance
+        """
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=POOL_SIZE)
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _search(
         self,
         query: str,
         category: Optional[str] = None,
@@ -30,6 +243,9 @@ class SearchTools:
     ) -> Dict[str, Any]:
         """Internal search method.
 
+        Identical queries are served from a short-lived cache. Responses
+        without results or with unresponsive engines are not cached.
+
         Args:
             query: Search query
             category: Search category (general, images, videos, news, etc.)
@@ -40,7 +256,7 @@ class SearchTools:
         Returns:
             Search results from SearXNG
         """
-        params = {
+        params: Dict[str, Any] = {
             "q": query,
             "format": "json",
             "language": language,
@@ -53,40 +269,33 @@ class SearchTools:
         if engines:
             params["engines"] = engines
 
+        cache_key = (query, category, engines, language, page)
+        cached: Optional[Dict[str, Any]] = self._cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("Cache hit: %s (category: %s)", query, category)
+            return cached
+
         try:
-            self.logger.info(f"Searching: {query} (category: {category})")
-            response = requests.get(
+            self.logger.info("Searching: %s (category: %s)", query, category)
+            response = await self._get_client().get(
                 f"{self.searxng_url}/search",
-                params=params,
-                timeout=self.timeout
+                params=params
             )
             response.raise_for_status()
-            return response.json()
+            # Parse the raw UTF-8 body directly rather than via response.text
+            data: Dict[str, Any] = orjson.loads(response.content)
         except Exception as e:
-            self.logger.error(f"Search failed: {e}")
+            self.logger.error("Search failed: %s", e)
             raise RuntimeError(f"Search failed: {e}")
 
-    def _deduplicate_results(self, results: List[Dict]) -> List[Dict]:
-        """Remove duplicate results by URL.
-
-        Args:
-            results: List of search results
-
-        Returns:
-            Deduplicated list
-        """
-        seen_urls = set()
-        unique_results = []
-
-        for result in results:
-            url = result.get('url', '')
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_results.append(result)
-
-        return unique_results
+        # Don't cache degraded responses so transient engine failures
+        # (timeouts, CAPTCHAs) are retried on the next call
+        if data.get("results") and not data.get("unresponsive_engines"):
+            ttl = NEWS_CACHE_TTL if category == "news" else CACHE_TTL
+            self._cache.set(cache_key, data, ttl)
+        return data
 
-    def search(
+    async def search(
         self,
         query: str,
         category: Literal["general", "news"] = "general",
@@ -104,29 +313,31 @@ class SearchTools:
         Returns:
             Formatted search results
         """
-        results = self._search(query, category=category, engines=engines)
+        results = await self._search(query, category=category, engines=engines)
 
         if category == "news":
-            output = f"📰 News Results for: {query}\n\n"
+            parts = [f"📰 News Results for: {query}\n\n"]
         else:
-            output = f"🔍 Search Results for: {query}\n\n"
-
-        for i, result in enumerate(results.get("results", [])[:max_results], 1):
-            output += f"{i}. **{result.get('title', 'No title')}**\n"
-            output += f"   {result.get('url', '')}\n"
-            if result.get('content'):
-                content = result['content'][:200] + "..." if len(result['content']) > 200 else result['content']
-                output += f"   {content}\n"
-            if category == "news" and result.get('publishedDate'):
-                output += f"   📅 {result['publishedDate']}\n"
-            output += "\n"
+            parts = [f"🔍 Search Results for: {query}\n\n"]
+
+        for i, result in enumerate(islice(results.get("results") or (), max_results), 1):
+            get = result.get
+            content = get('content')
+            published = get('publishedDate')
+            parts.append(f"{i}. **{get('title', 'No title')}**\n")
+            parts.append(f"   {get('url', '')}\n")
+            if content:
+                parts.append(f"   {_truncate(content, 200)}\n")
+            if category == "news" and published:
+                parts.append(f"   📅 {published}\n")
+            parts.append("\n")
 
         if not results.get("results"):
-            output += "No results found.\n"
+            parts.append("No results found.\n")
 
-        return [TextContent(type="text", text=output)]
+        return [TextContent(type="text", text="".join(parts))]
 
-    def search_media(
+    async def search_media(
         self,
         query: str,
         media_type: Literal["images", "videos"] = "images",
@@ -144,34 +355,39 @@ class SearchTools:
         Returns:
             Formatted media search results
         """
-        results = self._search(query, category=media_type, engines=engines)
+        results = await self._search(query, category=media_type, engines=engines)
 
         if media_type == "images":
-            output = f"🖼️ Image Results for: {query}\n\n"
-            for i, result in enumerate(results.get("results", [])[:max_results], 1):
-                output += f"{i}. **{result.get('title', 'No title')}**\n"
-                output += f"   URL: {result.get('img_src', 'N/A')}\n"
-                output += f"   Source: {result.get('url', 'N/A')}\n"
-                if result.get('thumbnail_src'):
-                    output += f"   Thumbnail: {result['thumbnail_src']}\n"
-                output += "\n"
+            parts = [f"🖼️ Image Results for: {query}\n\n"]
+            for i, result in enumerate(islice(results.get("results") or (), max_results), 1):
+                get = result.get
+                thumbnail = get('thumbnail_src')
+                parts.append(f"{i}. **{get('title', 'No title')}**\n")
+                parts.append(f"   URL: {get('img_src', 'N/A')}\n")
+                parts.append(f"   Source: {get('url', 'N/A')}\n")
+                if thumbnail:
+                    parts.append(f"   Thumbnail: {thumbnail}\n")
+                parts.append("\n")
         else:  # videos
-            output = f"🎥 Video Results for: {query}\n\n"
-            for i, result in enumerate(results.get("results", [])[:max_results], 1):
-                output += f"{i}. **{result.get('title', 'No title')}**\n"
-                output += f"   {result.get('url', '')}\n"
-                if result.get('content'):
-                    output += f"   {result['content']}\n"
-                if result.get('publishedDate'):
-                    output += f"   Published: {result['publishedDate']}\n"
-                output += "\n"
+            parts = [f"🎥 Video Results for: {query}\n\n"]
+            for i, result in enumerate(islice(results.get("results") or (), max_results), 1):
+                get = result.get
+                content = get('content')
+                published = get('publishedDate')
+                parts.append(f"{i}. **{get('title', 'No title')}**\n")
+                parts.append(f"   {get('url', '')}\n")
+                if content:
+                    parts.append(f"   {content}\n")
+                if published:
+                    parts.append(f"   Published: {published}\n")
+                parts.append("\n")
 
         if not results.get("results"):
-            output += f"No {media_type} found.\n"
+            parts.append(f"No {media_type} found.\n")
 
-        return [TextContent(type="text", text=output)]
+        return [TextContent(type="text", text="".join(parts))]
 
-    def research_topic(
+    async def research_topic(
         self,
         query: str,
         depth: Literal["quick", "standard", "deep"] = "standard"
@@ -180,106 +396,94 @@ class SearchTools:
 
         Performs multiple searches with different strategies to gather
         comprehensive information from diverse sources. Automatically
-        deduplicates results.
+        deduplicates results and stops once the depth's source cap is
+        reached.
 
         Args:
             query: Research topic
             depth: Research depth
-                - quick: 2 searches, ~15 unique results
-                - standard: 4 searches, ~30 unique results
-                - deep: 6 searches, ~50 unique results
+                - quick: up to 2 searches, up to 15 unique results
+                - standard: up to 4 searches, up to 30 unique results
+                - deep: up to 6 searches, up to 50 unique results
 
         Returns:
             Deduplicated and aggregated research results
         """
-        self.logger.info(f"Starting {depth} research on: {query}")
-
-        all_results = []
-        search_strategies = []
-
-        # Define search strategies based on depth
-        if depth == "quick":
-            search_strategies = [
-                {"category": "general", "engines": None},
-                {"category": "news", "engines": None},
-            ]
-            max_per_search = 10
-        elif depth == "standard":
-            search_strategies = [
-                {"category": "general", "engines": "google,bing"},
-                {"category": "general", "engines": "duckduckgo,brave"},
-                {"category": "news", "engines": None},
-                {"category": "general", "engines": "wikipedia"},
-            ]
-            max_per_search = 10
-        else:  # deep
-            search_strategies = [
-                {"category": "general", "engines": "google,bing"},
-                {"category": "general", "engines": "duckduckgo,brave"},
-                {"category": "news", "engines": "google,bing"},
-                {"category": "news", "engines": "duckduckgo"},
-                {"category": "general", "engines": "wikipedia"},
-                {"category": "general", "engines": None},  # All engines
-            ]
-            max_per_search = 15
-
-        # Execute all searches
-        for strategy in search_strategies:
+        self.logger.info("Starting %s research on: %s", depth, query)
+
+        seen_urls = set()
+        unique_results = []
+        strategies_used = 0
+        search_strategies = RESEARCH_STRATEGIES[depth]
+        max_per_search = RESEARCH_MAX_PER_SEARCH[depth]
+        max_sources = RESEARCH_MAX_SOURCES[depth]
+
+        async def run_strategy(category: str, engines: Optional[str]) -> Optional[List[Dict]]:
             try:
-                results = self._search(
-                    query,
-                    category=strategy["category"],
-                    engines=strategy["engines"]
-                )
-                all_results.extend(results.get("results", [])[:max_per_search])
+                results = await self._search(query, category=category, engines=engines)
+                hits: List[Dict] = results.get("results", [])
+                return hits[:max_per_search]
             except Exception as e:
-                self.logger.warning(f"Search strategy failed: {e}")
-                continue
-
-        # Deduplicate
-        unique_results = self._deduplicate_results(all_results)
+                self.logger.warning("Search strategy failed: %s", e)
+                return None
+
+        # Execute all searches concurrently, stopping once enough unique
+        # sources are gathered
+        tasks = [
+            asyncio.create_task(run_strategy(category, engines))
+            for category, engines in search_strategies
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                results = await next_done
+                if results is None:
+                    continue
+                strategies_used += 1
+
+                # Deduplicate by URL as results arrive
+                for result in results:
+                    url = result.get('url', '')
+                    if not url:
+                        continue
+                    key = _canonicalize(url)
+                    if key not in seen_urls:
+                        seen_urls.add(key)
+                        unique_results.append(result)
+                        if len(unique_results) == max_sources:
+                            break
+                if len(unique_results) == max_sources:
+                    break
+        finally:
+            # Cancel searches whose results are no longer needed and wait
+            # for their requests to be torn down before returning
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         # Format output - present as raw material to analyze, not numbered references
-        output = f"🔬 RESEARCH DATA for analysis: {query}\n"
-        output += f"📊 {len(unique_results)} unique sources gathered from {len(search_strategies)} search strategies\n\n"
-        output += f"{'='*80}\n"
-        output += f"RAW SOURCE MATERIAL (analyze and synthesize - do NOT list to user):\n"
-        output += f"{'='*80}\n\n"
+        parts = [f"🔬 RESEARCH DATA for analysis: {query}\n"]
+        parts.append(f"📊 {len(unique_results)} unique sources gathered from {strategies_used} of {len(search_strategies)} search strategies\n\n")
+        parts.append(_RESEARCH_SOURCES_BANNER)
 
-        for result in unique_results[:25]:
-            output += f"• **{result.get('title', 'No title')}**\n"
-            output += f"  URL: {result.get('url', '')}\n"
-            if result.get('content'):
-                content = result['content'][:100] + "..." if len(result['content']) > 100 else result['content']
-                output += f"  Content: {content}\n"
+        for result in unique_results:
+            get = result.get
+            content = get('content')
+            published = get('publishedDate')
+            parts.append(f"• **{get('title', 'No title')}**\n")
+            parts.append(f"  URL: {get('url', '')}\n")
+            if content:
+                parts.append(f"  Content: {_truncate(content, 100)}\n")
 
-            if result.get('publishedDate'):
-                output += f"  Date: {result['publishedDate']}\n"
+            if published:
+                parts.append(f"  Date: {published}\n")
 
-            output += "\n"
+            parts.append("\n")
 
         if not unique_results:
-            output += "No results found. Try a different query.\n"
-
-        output += f"\n{'='*80}\n"
-        output += f"⚠️  YOUR TASK: ANALYZE & SYNTHESIZE (NOT list sources!)\n"
-        output += f"{'='*80}\n\n"
-        output += f"You have {min(len(unique_results), 25)} sources above as RAW MATERIAL.\n\n"
-        output += f"REQUIRED ANALYSIS PROCESS:\n"
-        output += f"1. Read all source titles and content snippets above\n"
-        output += f"2. Extract key claims and facts from the content\n"
-        output += f"3. Cross-reference: What do MULTIPLE sources say? (HIGH confidence)\n"
-        output += f"4. What's only in ONE source? (LOW confidence - note as unverified)\n"
-        output += f"5. Any contradictions between sources? (flag for user)\n\n"
-        output += f"REQUIRED OUTPUT FORMAT:\n"
-        output += f"- Executive summary (2-3 sentences)\n"
-        output += f"- Key findings with confidence indicators:\n"
-        output += f"  ✓ HIGH (5+ sources agree)\n"
-        output += f"  ~ MEDIUM (2-4 sources)\n"
-        output += f"  ? LOW (single source only)\n"
-        output += f"- Contradictions/uncertainties if any\n"
-        output += f"- Brief conclusion\n\n"
-        output += f"DO NOT output source URLs or numbered lists - synthesize into narrative!\n"
-        output += f"{'='*80}\n"
-
-        return [TextContent(type="text", text=output)]
+            parts.append("No results found. Try a different query.\n")
+
+        parts.append(_RESEARCH_TASK_BANNER)
+        parts.append(f"You have {len(unique_results)} sources above as RAW MATERIAL.\n\n")
+        parts.append(_RESEARCH_INSTRUCTIONS)
+
+        return [TextContent(type="text", text="".join(parts))]
@@ -0,0 +1,151 @@
+"""Tests for the SearXNG response cache."""
+
+import asyncio
+import json
+
+import pytest
+
+from searxng_mcp.tools import search as search_module
+from searxng_mcp.tools.search import (
+    CACHE_MAX_SIZE,
+    CACHE_TTL,
+    NEWS_CACHE_TTL,
+    SearchTools,
+    _TTLCache,
+)
+
+
+class FakeClock:
+    """Controllable replacement for the cache clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.content = json.dumps(data).encode()
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeClient:
+    """Stands in for httpx.AsyncClient and counts requests."""
+
+    def __init__(self, data=None):
+        self.calls = 0
+        self.data = data
+
+    async def get(self, url, params=None):
+        self.calls += 1
+        if self.data is not None:
+            return FakeResponse(self.data)
+        return FakeResponse({"results": [{"url": f"https://example.com/{self.calls}"}]})
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(search_module, "_monotonic", fake)
+    return fake
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = _TTLCache(maxsize=4)
+    cache.set("key", "value", ttl=10)
+
+    clock.now += 9
+    assert cache.get("key") == "value"
+
+    clock.now += 1
+    assert cache.get("key") is None
+
+
+def test_evicts_oldest_entry_when_full(clock):
+    cache = _TTLCache(maxsize=CACHE_MAX_SIZE)
+    for i in range(CACHE_MAX_SIZE + 1):
+        cache.set(i, i, ttl=60)
+
+    assert cache.get(0) is None
+    assert cache.get(1) == 1
+    assert cache.get(CACHE_MAX_SIZE) == CACHE_MAX_SIZE
+
+
+def test_evicts_expired_entries_before_live_ones(clock):
+    cache = _TTLCache(maxsize=2)
+    cache.set("live", 1, ttl=60)
+    cache.set("short", 2, ttl=1)
+
+    clock.now += 5
+    cache.set("new", 3, ttl=60)
+
+    assert cache.get("live") == 1
+    assert cache.get("new") == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("category", "ttl"),
+    [("general", CACHE_TTL), ("news", NEWS_CACHE_TTL)],
+)
+async def test_search_cache_ttl_depends_on_category(clock, category, ttl):
+    tools = SearchTools("http://searxng.invalid")
+    client = FakeClient()
+    tools._client = client
+
+    first = await tools._search("query", category=category)
+    clock.now += ttl - 1
+    assert await tools._search("query", category=category) == first
+    assert client.calls == 1
+
+    clock.now += 1
+    await tools._search("query", category=category)
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_clock_fixture_leaves_event_loop_time_alone(clock):
+    await asyncio.wait_for(asyncio.sleep(0.01), timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_search_cache_keys_on_all_arguments(clock):
+    tools = SearchTools("http://searxng.invalid")
+    client = FakeClient()
+    tools._client = client
+
+    await tools._search("query", category="general")
+    await tools._search("query", category="general", engines="google")
+    await tools._search("query", category="general", page=2)
+    await tools._search("other", category="general")
+    assert client.calls == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"results": []},
+        {"results": [], "unresponsive_engines": [["google", "timeout"]]},
+        {
+            "results": [{"url": "https://example.com/1"}],
+            "unresponsive_engines": [["bing", "CAPTCHA"]],
+        },
+    ],
+    ids=["empty", "empty-unresponsive", "partial-unresponsive"],
+)
+async def test_degraded_responses_are_fetched_again(clock, data):
+    tools = SearchTools("http://searxng.invalid")
+    client = FakeClient(data)
+    tools._client = client
+
+    await tools._search("query", category="general", engines="google,bing")
+    await tools._search("query", category="general", engines="google,bing")
+    assert client.calls == 2
@@ -0,0 +1,71 @@
+"""Tests for configuration loading."""
+
+import json
+
+import pytest
+
+from searxng_mcp.config import Config, load_config
+from searxng_mcp.config import loader
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    loader._load_config_file.cache_clear()
+    yield
+    loader._load_config_file.cache_clear()
+
+
+def write_config(path, url="http://searxng.test:8080"):
+    path.write_text(json.dumps({
+        "searxng": {"url": url, "timeout": 5},
+        "logging": {"level": "DEBUG", "file": None},
+    }))
+
+
+def test_parses_config_file(tmp_path):
+    config_file = tmp_path / "config.json"
+    write_config(config_file)
+
+    config = load_config(str(config_file))
+
+    assert config.searxng.url == "http://searxng.test:8080"
+    assert config.searxng.timeout == 5
+    assert config.logging.level == "DEBUG"
+
+
+def test_parses_config_with_orjson(tmp_path):
+    orjson = pytest.importorskip("orjson")
+    assert loader.orjson is orjson
+
+    config_file = tmp_path / "config.json"
+    write_config(config_file, url="http://ünïcode.test")
+
+    assert load_config(str(config_file)).searxng.url == "http://ünïcode.test"
+
+
+def test_equivalent_paths_share_cached_config(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.json"
+    write_config(config_file)
+    monkeypatch.chdir(tmp_path)
+
+    first = load_config(str(config_file))
+
+    assert load_config("config.json") is first
+    assert load_config(str(tmp_path / "." / "config.json")) is first
+
+
+def test_env_path_is_used(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.json"
+    write_config(config_file, url="http://from-env.test")
+    monkeypatch.setenv("SEARXNG_MCP_CONFIG", str(config_file))
+
+    assert load_config().searxng.url == "http://from-env.test"
+
+
+def test_missing_file_returns_defaults_without_caching(tmp_path):
+    config_file = tmp_path / "config.json"
+
+    assert load_config(str(config_file)) == Config()
+
+    write_config(config_file)
+    assert load_config(str(config_file)).searxng.url == "http://searxng.test:8080"
@@ -0,0 +1,112 @@
+"""Tests for search tool helpers."""
+
+import asyncio
+
+import pytest
+
+from searxng_mcp.tools.search import RESEARCH_MAX_SOURCES, SearchTools, _canonicalize
+
+
+def test_canonicalize_strips_trailing_slash_and_case():
+    assert _canonicalize("HTTPS://Example.com/x/") == "https://example.com/x"
+    assert _canonicalize("https://example.com/x") == "https://example.com/x"
+
+
+def test_canonicalize_drops_tracking_params_and_fragment():
+    url = "https://example.com/x?utm_source=a&b=1&fbclid=z&gclid=y#frag"
+    assert _canonicalize(url) == "https://example.com/x?b=1"
+
+
+def test_canonicalize_keeps_hash_route_fragments():
+    assert _canonicalize("https://site.com/#/a") == "https://site.com#/a"
+    assert _canonicalize("https://site.com/#/b") == "https://site.com#/b"
+    assert _canonicalize("https://site.com/#!/a") == "https://site.com#!/a"
+    assert _canonicalize("https://site.com/page#section") == "https://site.com/page"
+
+
+def test_canonicalize_returns_malformed_url_unchanged():
+    assert _canonicalize("http://[bad") == "http://[bad"
+
+
+@pytest.mark.asyncio
+async def test_research_topic_tolerates_malformed_urls():
+    tools = SearchTools("http://searxng.invalid")
+
+    async def fake_search(query, category=None, engines=None, **kwargs):
+        return {"results": [
+            {"url": "http://[bad", "title": "Bad"},
+            {"url": "https://example.com/a/", "title": "A"},
+            {"url": "https://example.com/a?utm_source=x", "title": "A again"},
+        ]}
+
+    tools._search = fake_search
+    result = await tools.research_topic("topic", "standard")
+
+    text = result[0].text
+    assert "http://[bad" in text
+    assert "2 unique sources" in text
+
+
+@pytest.mark.asyncio
+async def test_research_topic_reports_strategies_used():
+    tools = SearchTools("http://searxng.invalid")
+
+    async def fake_search(query, category=None, engines=None, **kwargs):
+        if engines == "wikipedia":
+            raise RuntimeError("Search failed: boom")
+        return {"results": [
+            {"url": f"https://example.com/{category}/{engines}/{i}", "title": str(i)}
+            for i in range(15)
+        ]}
+
+    tools._search = fake_search
+
+    result = await tools.research_topic("topic", "standard")
+    assert "from 3 of 4 search strategies" in result[0].text
+
+    # Deep mode reaches the source cap before every strategy is consumed
+    result = await tools.research_topic("topic", "deep")
+    assert "50 unique sources gathered from 4 of 6 search strategies" in result[0].text
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("depth", ["quick", "standard", "deep"])
+async def test_research_topic_caps_sources_per_depth(depth):
+    tools = SearchTools("http://searxng.invalid")
+
+    async def fake_search(query, category=None, engines=None, **kwargs):
+        return {"results": [
+            {"url": f"https://example.com/{category}/{engines}/{i}", "title": str(i)}
+            for i in range(20)
+        ]}
+
+    tools._search = fake_search
+    result = await tools.research_topic("topic", depth)
+
+    expected = RESEARCH_MAX_SOURCES[depth]
+    assert f"📊 {expected} unique sources" in result[0].text
+    assert result[0].text.count("• **") == expected
+
+
+@pytest.mark.asyncio
+async def test_research_topic_finishes_cancelled_searches():
+    tools = SearchTools("http://searxng.invalid")
+    cancelled = []
+
+    async def fake_search(query, category=None, engines=None, **kwargs):
+        if engines in ("wikipedia", None):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(engines)
+                raise
+        return {"results": [
+            {"url": f"https://example.com/{category}/{engines}/{i}", "title": str(i)}
+            for i in range(15)
+        ]}
+
+    tools._search = fake_search
+    await tools.research_topic("topic", "deep")
+
+    # The four fast searches fill the cap; the other two are cancelled
+    assert len(cancelled) == 2